@@ -12,7 +12,13 @@ cases.
 
 from __future__ import annotations
 
-from .tree import path_tree
-from .content import path_content
+from .tree import iter_path_tree, path_tree
+from .content import iter_path_content, path_content, path_content_stream
 
-__all__ = ["path_tree", "path_content"]
+__all__ = [
+    "path_tree",
+    "iter_path_tree",
+    "path_content",
+    "path_content_stream",
+    "iter_path_content",
+]
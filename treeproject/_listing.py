@@ -0,0 +1,158 @@
+# treeproject/_listing.py
+
+"""
+Shared directory listing and filter helpers.
+
+Both :func:`treeproject.path_tree` and :func:`treeproject.path_content` list
+directories in the same deterministic order: directories first, then files,
+each group sorted case-insensitively by name. This module performs that
+listing once per directory with ``os.scandir`` and a decorate-sort-undecorate
+pass, so the sort keys are computed a single time per entry and entry types
+come from the cached ``os.DirEntry`` information. On POSIX that is the
+``d_type`` reported by the directory read; on Windows, ``DirEntry`` also
+caches the attributes and size returned by ``FindNextFileW``, so type checks
+and ``DirEntry.stat()`` of non-symlinks need no extra system call there.
+
+It also holds the preprocessing of ``include`` arguments, which both public
+functions accept in the same two forms.
+"""
+
+
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+# Number of directory listings kept by ``list_children_cached``.
+_LISTING_CACHE_SIZE = 1024
+
+
+def _entry_is_dir(entry: os.DirEntry[str]) -> bool:
+    """
+    Return whether a directory entry is a directory (following symlinks), or
+    ``False`` if that cannot be determined.
+
+    ``DirEntry.is_dir`` answers from the type cached by ``os.scandir`` on most
+    platforms and only falls back to a ``stat`` call for symlinks or unknown
+    types. That call can raise ``OSError`` (e.g. on permission issues), which
+    is treated as "not a directory", without any ``pathlib`` round-trip.
+    """
+
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def list_children(path: str | int) -> list[tuple[os.DirEntry[str], bool]]:
+    """
+    List the immediate children of a directory in stable tree order.
+
+    Directories (following symbolic links) come before everything else, and
+    entries are ordered case-insensitively by name within each group. If the
+    directory cannot be read, an empty list is returned.
+
+    Parameters
+    ----------
+    path : str | int
+        Directory whose children should be listed, or an open directory file
+        descriptor on platforms where ``os.scandir`` supports it. Entries
+        listed through a descriptor have their bare name as ``path``.
+
+    Returns
+    -------
+    list[tuple[os.DirEntry[str], bool]]
+        Sorted ``(entry, is_dir)`` pairs. ``is_dir`` is ``False`` when the
+        entry type cannot be determined.
+    """
+
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return []
+
+    decorated: list[tuple[bool, str, int, os.DirEntry[str], bool]] = []
+    for i, entry in enumerate(entries):
+        entry_is_dir = _entry_is_dir(entry)
+        # The index keeps the sort stable and stops comparisons reaching the
+        # (unorderable) DirEntry objects.
+        decorated.append(
+            (not entry_is_dir, entry.name.casefold(), i, entry, entry_is_dir)
+        )
+
+    decorated.sort()
+    return [(entry, entry_is_dir) for _, _, _, entry, entry_is_dir in decorated]
+
+
+@functools.lru_cache(maxsize=_LISTING_CACHE_SIZE)
+def _listing_snapshot(
+    path: str, mtime_ns: int, ctime_ns: int
+) -> tuple[tuple[os.DirEntry[str], bool], ...]:
+    # The timestamps only take part in the cache key.
+    return tuple(list_children(path))
+
+
+def list_children_cached(path: str) -> Sequence[tuple[os.DirEntry[str], bool]]:
+    """
+    Like :func:`list_children`, but reuse a previous listing of ``path`` when
+    the directory has not changed since.
+
+    Listings are cached per directory, keyed by path and by the directory's
+    modification and change times, which the filesystem updates whenever an
+    entry is added, removed or renamed. A warm lookup costs a single ``stat``
+    call instead of a full scan. Only the ``_LISTING_CACHE_SIZE`` most
+    recently used listings are kept.
+
+    Changes that do not touch the directory itself, such as a symlinked
+    directory being retargeted, are not detected; neither are changes made
+    within the timestamp granularity of the filesystem after a listing was
+    cached.
+
+    Parameters
+    ----------
+    path : str
+        Directory whose children should be listed.
+
+    Returns
+    -------
+    Sequence[tuple[os.DirEntry[str], bool]]
+        Sorted ``(entry, is_dir)`` pairs, as returned by ``list_children``.
+    """
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    return _listing_snapshot(path, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def accept_all(p: Path) -> bool:
+    """
+    Default ``include`` predicate, accepting every path.
+
+    Walkers compare ``include`` against this function by identity and skip
+    the predicate call (and the ``pathlib.Path`` it needs) altogether.
+    """
+
+    return True
+
+
+def include_suffixes(
+    include: Callable[[Path], bool] | Iterable[str],
+) -> tuple[str, ...] | None:
+    """
+    Return the file suffixes of an extension-list ``include``.
+
+    Returns ``None`` when ``include`` is a predicate rather than a collection
+    of suffixes such as ``[".py", ".md"]``. A single string is treated as a
+    one-element collection. The result is suitable for ``str.endswith``.
+    """
+
+    if callable(include):
+        return None
+    if isinstance(include, str):
+        return (include,)
+    return tuple(include)
@@ -19,8 +19,37 @@ Features include:
 
 from __future__ import annotations
 
+import mmap
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Literal
+from typing import IO, Callable, Iterable, Iterator, Literal
+
+from ._listing import accept_all, include_suffixes, list_children
+
+# Bytes considered textual by the binary heuristic: printable ASCII plus
+# common control characters (BEL, BS, TAB, LF, FF, CR, ESC).
+_TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(32, 127))))
+
+# Pieces of the ``file_to_text`` block format, around the header path and data.
+_BLOCK_OPEN = "===== FILE: "
+_BLOCK_HEADER_CLOSE = " =====\n"
+_BLOCK_CLOSE = "\n===== END FILE ====="
+_BLOCK_SEPARATOR = "\n\n"
+
+# Suffixes treated as text by convention. When an extension-list ``include``
+# only selects these, binary sampling is skipped for the whole walk. Suffixes
+# also used by common binary formats (e.g. ``.ts`` for MPEG transport streams)
+# are deliberately left out.
+_TEXT_EXTENSIONS = frozenset(
+    ".txt .md .rst .py .pyi .json .yaml .yml .toml .ini .cfg .csv .html .css"
+    " .js .c .h .cpp .hpp .java .go .rs .sh .sql".split()
+)
+
+# Files larger than this are decoded straight from a read-only memory map
+# instead of being copied into an intermediate ``bytes`` object first.
+_MMAP_THRESHOLD = 1 << 20
 
 
 def file_to_text(
@@ -67,14 +96,37 @@ def file_to_text(
     if not path.is_file():
         raise ValueError(f"Not a file: {path}")
 
-    data = path.read_text(encoding=encoding)  # may raise UnicodeDecodeError / OSError
+    # Without binary sampling, _read_text always returns the decoded text.
+    data = _read_text(os.fspath(path), encoding=encoding, skip_binary=False)
 
-    if root is not None:
-        header_path = path.resolve().relative_to(root.resolve()).as_posix()
-    else:
-        header_path = path.resolve().as_posix()
+    header_path = _header_path(os.fspath(path), root=root)
+    return "".join((_BLOCK_OPEN, header_path, _BLOCK_HEADER_CLOSE, data, _BLOCK_CLOSE))
+
+
+def _decode_text(data: bytes | mmap.mmap, encoding: str) -> str:
+    """
+    Decode raw file bytes the same way ``Path.read_text`` would.
+
+    Newlines are translated as in universal-newline text mode, so ``\\r\\n``
+    and lone ``\\r`` both become ``\\n``. Any buffer object is accepted, so a
+    memory map is decoded in place without an intermediate copy.
+    """
 
-    return f"===== FILE: {header_path} =====\n" f"{data}\n" f"===== END FILE ====="
+    text = str(data, encoding)  # may raise UnicodeDecodeError
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _header_path(path: str, *, root: Path | None) -> str:
+    """
+    Return the path displayed in a ``file_to_text`` block header.
+    """
+
+    resolved = Path(path).resolve()
+    if root is not None:
+        return resolved.relative_to(root.resolve()).as_posix()
+    return resolved.as_posix()
 
 
 def is_binary_file(path: Path, *, sample_size: int = 8192) -> bool:
@@ -114,22 +166,78 @@ def is_binary_file(path: Path, *, sample_size: int = 8192) -> bool:
     with path.open("rb") as f:
         sample = f.read(sample_size)
 
+    return _classify_bytes(sample)
+
+
+def _classify_bytes(sample: bytes) -> bool:
+    """
+    Apply the ``is_binary_file`` heuristic to an in-memory byte sample.
+    """
+
     if b"\x00" in sample:
         return True
 
-    text_bytes = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(32, 127)))
-    non_text = sum(b not in text_bytes for b in sample)
-    return non_text / max(len(sample), 1) > 0.30
+    # Deleting every text byte leaves only the non-text ones, in a C loop.
+    non_text = len(sample.translate(None, _TEXT_BYTES))
+    # More than 30% non-text bytes, compared in integer arithmetic.
+    return non_text * 10 > len(sample) * 3
+
+
+def _read_text(
+    path: str,
+    *,
+    encoding: str,
+    skip_binary: bool,
+    size: int | None = None,
+    sample_size: int = 8192,
+) -> str | None:
+    """
+    Read and decode a regular file through a single ``open`` call.
+
+    When ``skip_binary`` is set, the first ``sample_size`` bytes are classified
+    with the ``is_binary_file`` heuristic before the rest of the file is read,
+    so binary detection and content extraction share one file handle. Files
+    larger than ``_MMAP_THRESHOLD`` are memory-mapped and decoded in place.
+
+    ``size`` is the file size when already known from a previous ``stat``
+    (e.g. a cached ``os.DirEntry`` result); otherwise it is fetched with
+    ``fstat`` when needed.
+
+    Returns
+    -------
+    str | None
+        The decoded file contents, or ``None`` if the file was detected as
+        binary.
+    """
+
+    with open(path, "rb") as f:
+        head = b""
+        if skip_binary:
+            head = f.read(sample_size)
+            if _classify_bytes(head):
+                return None
+            # A short sample means the whole file has already been read.
+            if len(head) < sample_size:
+                return _decode_text(head, encoding)
+
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _decode_text(mm, encoding)
+        return _decode_text(head + f.read(), encoding)
 
 
 def path_content(
     root: Path,
     *,
     follow_symlinks: bool = False,
-    include: Callable[[Path], bool] = lambda p: True,
+    include: Callable[[Path], bool] | Iterable[str] = accept_all,
     skip_binary: bool = True,
     encoding: str = "utf-8",
     errors: Literal["raise", "skip"] = "raise",
+    workers: int = 1,
+    max_file_bytes: int | None = None,
 ) -> str:
     """
     Collect and concatenate the textual contents of files under a path.
@@ -139,12 +247,20 @@ def path_content(
     returns a single string containing the formatted contents of all selected
     files.
 
-    Directory traversal follows ``pathlib.Path.walk`` semantics and supports
-    optional symbolic link following. Directory pruning is performed in-place
-    to avoid descending into excluded paths.
+    Directory traversal is performed iteratively with ``os.scandir`` and
+    supports optional symbolic link following. Entry types are read from the
+    cached ``os.DirEntry`` information, and excluded directories are pruned
+    before being descended into.
+
+    Each file is rendered in the ``file_to_text`` block format, and blocks are
+    concatenated with blank lines between them. The walk itself is always
+    sequential; with ``workers > 1``, the selected files are then read and
+    decoded by a thread pool, and the blocks are still emitted in traversal
+    order.
 
-    Each file is rendered using ``file_to_text`` and concatenated with blank
-    lines between blocks.
+    To write blocks to a file-like object as they are produced instead of
+    building one string, use ``path_content_stream``; to consume them lazily,
+    use ``iter_path_content``.
 
     Parameters
     ----------
@@ -152,17 +268,34 @@ def path_content(
         Root path to process. May be a file or a directory.
     follow_symlinks : bool, default=False
         Whether to follow symbolic links during traversal.
-    include : Callable[[pathlib.Path], bool], optional
+    include : Callable[[pathlib.Path], bool] | Iterable[str], optional
         Predicate used to filter paths. If it returns ``False`` for a path,
         that path is ignored; directories are also pruned and not descended into.
+        By default every path is accepted without calling any predicate.
+        A collection of file suffixes (e.g. ``[".py", ".md"]``) may be given
+        instead: only files whose name ends with one of them are kept, and no
+        directory is pruned. Suffixes are matched case-sensitively against
+        entry names directly, without building ``pathlib.Path`` objects.
     skip_binary : bool, default=True
         If ``True``, files detected as binary via ``is_binary_file`` are skipped.
+        Detection is not performed when ``include`` is a suffix collection
+        made only of well-known text extensions (``.py``, ``.md``, ``.txt``,
+        ...), since such files are text by convention; this applies even when
+        ``skip_binary=True`` is passed explicitly.
     encoding : str, default="utf-8"
         Text encoding used when reading files.
     errors : {"raise", "skip"}, default="raise"
         Error handling strategy when reading or decoding a file:
         - ``"raise"`` propagates the exception,
         - ``"skip"`` silently ignores the file.
+    workers : int, default=1
+        Number of threads used to read files. ``1`` reads files sequentially
+        in the calling thread. Larger values help on high-latency storage
+        (network filesystems, cold caches) where reads dominate.
+    max_file_bytes : int | None, default=None
+        If set, files larger than this many bytes are skipped without being
+        opened. Sizes come from the ``stat`` information of the walked
+        entries.
 
     Returns
     -------
@@ -173,49 +306,310 @@ def path_content(
     Raises
     ------
     ValueError
-        If ``root`` is neither a file nor a directory.
+        If ``root`` is neither a file nor a directory, or if ``workers`` is
+        lower than 1.
     OSError
         If a filesystem operation fails and ``errors="raise"``.
     UnicodeDecodeError
         If decoding fails and ``errors="raise"``.
     """
-    root = root.resolve()
-    blocks: list[str] = []
+    files = _iter_files(
+        root,
+        follow_symlinks=follow_symlinks,
+        include=include,
+        skip_binary=skip_binary,
+        encoding=encoding,
+        errors=errors,
+        workers=workers,
+        max_file_bytes=max_file_bytes,
+    )
+
+    # Build the output from a flat list of pieces joined once, rather than
+    # formatting each block into its own intermediate string first.
+    parts: list[str] = []
+    for header_path, data in files:
+        if parts:
+            parts.append(_BLOCK_SEPARATOR)
+        parts += (_BLOCK_OPEN, header_path, _BLOCK_HEADER_CLOSE, data, _BLOCK_CLOSE)
+
+    return "".join(parts)
+
+
+def path_content_stream(
+    root: Path,
+    *,
+    out: IO[str],
+    follow_symlinks: bool = False,
+    include: Callable[[Path], bool] | Iterable[str] = accept_all,
+    skip_binary: bool = True,
+    encoding: str = "utf-8",
+    errors: Literal["raise", "skip"] = "raise",
+    workers: int = 1,
+    max_file_bytes: int | None = None,
+) -> None:
+    """
+    Write the textual contents of files under a path to a text stream.
+
+    This is the streaming counterpart of ``path_content``: it performs the same
+    walk, filtering and formatting, but writes each block to ``out`` as soon
+    as it is ready instead of returning the concatenated result. Peak memory
+    therefore stays bounded by the largest file rather than the whole output,
+    which matters when bundling large trees straight into a log file or
+    ``sys.stdout``.
+
+    The text written to ``out`` is exactly the string ``path_content`` would
+    return for the same arguments.
+
+    Parameters
+    ----------
+    root : pathlib.Path
+        Root path to process. May be a file or a directory.
+    out : IO[str]
+        Text stream receiving the formatted blocks, e.g. an open file or
+        ``sys.stdout``.
+    follow_symlinks, include, skip_binary, encoding, errors, workers, max_file_bytes
+        Same meaning as for ``path_content``.
+
+    Raises
+    ------
+    ValueError
+        If ``root`` is neither a file nor a directory, or if ``workers`` is
+        lower than 1.
+    OSError
+        If a filesystem operation fails and ``errors="raise"``.
+    UnicodeDecodeError
+        If decoding fails and ``errors="raise"``.
+    """
+    files = _iter_files(
+        root,
+        follow_symlinks=follow_symlinks,
+        include=include,
+        skip_binary=skip_binary,
+        encoding=encoding,
+        errors=errors,
+        workers=workers,
+        max_file_bytes=max_file_bytes,
+    )
+
+    for i, (header_path, data) in enumerate(files):
+        if i:
+            out.write(_BLOCK_SEPARATOR)
+        out.write(_BLOCK_OPEN)
+        out.write(header_path)
+        out.write(_BLOCK_HEADER_CLOSE)
+        out.write(data)
+        out.write(_BLOCK_CLOSE)
+
+
+def iter_path_content(
+    root: Path,
+    *,
+    follow_symlinks: bool = False,
+    include: Callable[[Path], bool] | Iterable[str] = accept_all,
+    skip_binary: bool = True,
+    encoding: str = "utf-8",
+    errors: Literal["raise", "skip"] = "raise",
+    workers: int = 1,
+    max_file_bytes: int | None = None,
+) -> Iterator[str]:
+    """
+    Lazily yield the formatted content blocks of files under a path.
+
+    This is the generator counterpart of ``path_content``: each selected file
+    is yielded as one ``file_to_text``-style block as soon as it has been read,
+    so callers can start consuming output while the walk is still in
+    progress. Joining the blocks with ``"\\n\\n"`` gives exactly the string
+    ``path_content`` returns for the same arguments.
 
-    def should_follow(p: Path) -> bool:
-        return follow_symlinks or not p.is_symlink()
+    With the default ``workers=1``, walking and reading are interleaved, and
+    only the current block is held in memory. With ``workers > 1``, the walk
+    completes first and files are read ahead by the thread pool.
 
-    def safe_add_file(p: Path) -> None:
-        if skip_binary and is_binary_file(p):
-            return
+    Parameters
+    ----------
+    root : pathlib.Path
+        Root path to process. May be a file or a directory.
+    follow_symlinks, include, skip_binary, encoding, errors, workers, max_file_bytes
+        Same meaning as for ``path_content``.
+
+    Returns
+    -------
+    Iterator[str]
+        One formatted block per selected file, in traversal order.
+
+    Raises
+    ------
+    ValueError
+        If ``root`` is neither a file nor a directory, or if ``workers`` is
+        lower than 1. Raised when the function is called, before iteration.
+    OSError
+        If a filesystem operation fails and ``errors="raise"``.
+    UnicodeDecodeError
+        If decoding fails and ``errors="raise"``.
+    """
+    files = _iter_files(
+        root,
+        follow_symlinks=follow_symlinks,
+        include=include,
+        skip_binary=skip_binary,
+        encoding=encoding,
+        errors=errors,
+        workers=workers,
+        max_file_bytes=max_file_bytes,
+    )
+
+    return (
+        "".join((_BLOCK_OPEN, header_path, _BLOCK_HEADER_CLOSE, data, _BLOCK_CLOSE))
+        for header_path, data in files
+    )
+
+
+def _iter_files(
+    root: Path,
+    *,
+    follow_symlinks: bool,
+    include: Callable[[Path], bool] | Iterable[str],
+    skip_binary: bool,
+    encoding: str,
+    errors: Literal["raise", "skip"],
+    workers: int,
+    max_file_bytes: int | None,
+) -> Iterator[tuple[str, str]]:
+    """
+    Walk ``root`` and lazily yield ``(header_path, text)`` for selected files.
+
+    This is the shared engine behind ``path_content``, ``path_content_stream``
+    and ``iter_path_content``, which only differ in how they emit blocks.
+    Arguments are validated and the root is classified eagerly, so invalid
+    input raises before the first item is requested.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    root = root.resolve()
+    suffixes = include_suffixes(include)
+    filtering = include is not accept_all
+
+    if suffixes is not None and _TEXT_EXTENSIONS.issuperset(suffixes):
+        # Only text-by-convention files can be selected: sampling is wasted.
+        skip_binary = False
+
+    # Without symlink following, every walked path is already canonical and
+    # starts with the resolved root, so headers are derived by stripping this
+    # prefix instead of resolving each file again.
+    root_prefix = os.path.join(os.fspath(root), "")
+
+    def header_for(p: str) -> str:
+        if follow_symlinks:
+            return _header_path(p, root=root)
+        return p[len(root_prefix) :].replace(os.sep, "/") or "."
+
+    def load_file(
+        item: tuple[str, os.DirEntry[str] | os.stat_result],
+    ) -> tuple[str, str] | None:
+        # ``p`` is known to be a regular file: binary sampling and content
+        # reading share a single open() call. The DirEntry is only stat'ed
+        # when ``max_file_bytes`` needs a size (free on Windows, a syscall on
+        # POSIX); otherwise ``_read_text`` fetches one lazily, and not at all
+        # for files shorter than its binary-detection sample.
+        p, source = item
         try:
-            blocks.append(file_to_text(p, root=root, encoding=encoding))
+            size = source.st_size if isinstance(source, os.stat_result) else None
+            if max_file_bytes is not None:
+                if isinstance(source, os.DirEntry):
+                    size = source.stat(follow_symlinks=follow_symlinks).st_size
+                if size is not None and size > max_file_bytes:
+                    return None
+            # A zero size is not trusted: procfs, sysfs and some FUSE files
+            # report it while still having content, and reading a truly empty
+            # file costs a single read() call.
+            data = _read_text(p, encoding=encoding, skip_binary=skip_binary, size=size)
+            if data is None:
+                return None
+            return header_for(p), data
         except (OSError, UnicodeDecodeError):
             if errors == "skip":
-                return
+                return None
             raise
 
-    if root.is_file():
-        if include(root) and should_follow(root):
-            safe_add_file(root)
-        return "\n\n".join(blocks)
-
-    if not root.is_dir():
+    def walk(dirpath: str) -> Iterator[tuple[str, os.DirEntry[str]]]:
+        # Yields selected files lazily, in traversal order, each with the
+        # DirEntry it was reached through.
+        stack = [dirpath]
+        while stack:
+            dirpath = stack.pop()
+
+            # Children come back sorted (directories first), so splitting them
+            # keeps each group in order without sorting again.
+            dirs: list[os.DirEntry[str]] = []
+            files: list[os.DirEntry[str]] = []
+            for entry, entry_is_dir in list_children(dirpath):
+                # DirEntry type checks reuse the d_type cached by scandir.
+                if not follow_symlinks and entry.is_symlink():
+                    continue
+                if entry_is_dir:
+                    bucket = dirs
+                else:
+                    try:
+                        if not entry.is_file(follow_symlinks=follow_symlinks):
+                            continue
+                    except OSError:
+                        # Entries whose type cannot be determined are skipped.
+                        continue
+                    bucket = files
+
+                if suffixes is not None:
+                    # Extension lists only filter files, by a C-level endswith.
+                    if bucket is files and not entry.name.endswith(suffixes):
+                        continue
+                elif filtering and not include(Path(entry.path)):
+                    continue
+                bucket.append(entry)
+
+            for entry in files:
+                yield entry.path, entry
+            # Push in reverse so directories are visited in order.
+            stack.extend(entry.path for entry in reversed(dirs))
+
+    # Selected files, with their DirEntry when reached through the walk, or
+    # their already-fetched stat result for a file root.
+    selected: Iterable[tuple[str, os.DirEntry[str] | os.stat_result]]
+
+    # A single stat classifies the root. Once resolved, the root is never a
+    # symlink itself, so no separate is_symlink check is needed.
+    try:
+        root_st: os.stat_result | None = root.stat()
+    except OSError:
+        root_st = None
+
+    if root_st is not None and stat.S_ISREG(root_st.st_mode):
+        keep = root.name.endswith(suffixes) if suffixes is not None else include(root)
+        selected = [(os.fspath(root), root_st)] if keep else []
+    elif root_st is None or not stat.S_ISDIR(root_st.st_mode):
         raise ValueError(f"Not a file or directory: {root}")
-
-    for dirpath, dirnames, filenames in root.walk(follow_symlinks=follow_symlinks):
-        # Prune dirs in-place + stable sort
-        kept = [
-            name
-            for name in dirnames
-            if include(dirpath / name) and should_follow(dirpath / name)
-        ]
-        dirnames[:] = sorted(kept, key=str.casefold)
-
-        for name in sorted(filenames, key=str.casefold):
-            p = dirpath / name
-            if not include(p) or not should_follow(p):
-                continue
-            safe_add_file(p)
-
-    return "\n\n".join(blocks)
+    else:
+        selected = walk(os.fspath(root))
+
+    def load_all() -> Iterator[tuple[str, str]]:
+        if workers > 1:
+            # The walk is consumed up front by the pool; results are still
+            # yielded in submission order, keeping output deterministic.
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = [pool.submit(load_file, item) for item in selected]
+                try:
+                    for future in loaded:
+                        block = future.result()
+                        if block is not None:
+                            yield block
+                finally:
+                    # Do not read files nobody will consume (early close or error).
+                    for future in loaded:
+                        future.cancel()
+        else:
+            # Sequentially, walking and reading are interleaved lazily.
+            for item in selected:
+                block = load_file(item)
+                if block is not None:
+                    yield block
+
+    return load_all()
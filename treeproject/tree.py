@@ -12,51 +12,54 @@ supports optional symbolic link following, and relies on strict pruning-based
 filtering: if a directory is excluded, its entire subtree is skipped.
 
 The main entry point is :func:`path_tree`, which returns the rendered tree
-as a string.
+as a string; :func:`iter_path_tree` yields the same output line by line.
 """
 
 
 from __future__ import annotations
 
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
+from ._listing import accept_all, include_suffixes, list_children, list_children_cached
 
-def is_dir(p: Path) -> bool:
-    """
-    Safely determine whether a path refers to a directory.
-
-    This helper wraps ``Path.is_dir()`` to guard against filesystem-related
-    errors (e.g. permission issues), returning ``False`` if the directory
-    status cannot be determined.
+# On POSIX, directories are opened relative to their parent's file descriptor
+# (``openat``) and listed through that descriptor, so the kernel does not
+# resolve the full path from the root again for every directory. Platforms
+# without ``dir_fd``/``fd`` support fall back to path-based listing.
+_FD_WALK = os.open in os.supports_dir_fd and os.scandir in os.supports_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+_O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+# One descriptor stays open per directory on the current branch; deeper
+# directories are listed by path so the walk never exhausts the fd limit.
+_MAX_OPEN_DIRS = 32
 
-    Parameters
-    ----------
-    p : pathlib.Path
-        Path to test.
-
-    Returns
-    -------
-    bool
-        ``True`` if the path is a directory, ``False`` otherwise.
-    """
+# Tree connectors, indexed by "is last child": the branch drawn before an
+# entry, and the continuation added to the prefix of its children.
+_BRANCHES = ("├── ", "└── ")
+_EXTS = ("│   ", "    ")
 
-    try:
-        return p.is_dir()
-    except OSError:
-        return False
+# A listed child: its directory entry, whether it is a directory (following
+# symlinks), and whether the walk descends into it.
+_Child = tuple[os.DirEntry[str], bool, bool]
 
 
 def path_tree(
     root: Path,
     *,
     follow_symlinks: bool = False,
-    include: Callable[[Path], bool] = lambda p: True,
+    include: Callable[[Path], bool] | Iterable[str] = accept_all,
+    workers: int = 1,
+    cache: bool = False,
+    resolve: bool = False,
 ) -> str:
     """
     Render a directory tree as a Unicode string using a tree-style layout.
 
-    Starting from ``root``, this function recursively traverses the filesystem
+    Starting from ``root``, this function traverses the filesystem depth-first
     and produces a visual representation of the directory structure using
     tree-style connectors (``├──``, ``└──``, ``│``).
 
@@ -71,13 +74,38 @@ def path_tree(
     Parameters
     ----------
     root : pathlib.Path
-        Root directory to display.
+        Root directory to display. The root itself is always entered, even
+        if it is a symbolic link.
     follow_symlinks : bool, default=False
         Whether to follow symbolic links to directories during traversal.
-    include : Callable[[pathlib.Path], bool], optional
+    include : Callable[[pathlib.Path], bool] | Iterable[str], optional
         Predicate used to filter paths. If it returns ``False`` for a path,
         that path is neither displayed nor traversed. For directories, this
-        results in full subtree pruning.
+        results in full subtree pruning. As with ``path_content``, a collection
+        of file suffixes (e.g. ``[".py", ".md"]``) may be given instead: only
+        files ending with one of them are shown, and no directory is pruned.
+        By default every path is shown without calling any predicate. Walked
+        entries are plain ``os.DirEntry`` records; a ``pathlib.Path`` is only
+        built for an entry when it is passed to a user-supplied predicate.
+    workers : int, default=1
+        Number of threads used to walk the tree. ``1`` walks sequentially in
+        the calling thread. Larger values render the top-level subdirectories
+        concurrently, which helps on high-latency storage (network
+        filesystems, FUSE mounts, cold caches); ``include`` may then be called
+        from several threads at once. The output does not depend on it.
+    cache : bool, default=False
+        Whether to reuse directory listings from previous calls. Listings are
+        kept per directory and reused while the directory's modification and
+        change times are unchanged, so a repeated call on an unchanged tree
+        costs one ``stat`` per directory instead of a full scan. Meant for
+        callers rendering the same tree repeatedly (e.g. watch modes);
+        ``include`` is still applied on every call.
+    resolve : bool, default=False
+        Whether to resolve symbolic links in an absolute ``root`` before
+        displaying it. By default an absolute root is displayed and walked
+        exactly as given, which avoids a ``stat`` per path component; ``..``
+        components are left for the filesystem to interpret. Relative roots
+        are always made absolute with symbolic links resolved.
 
     Returns
     -------
@@ -88,12 +116,128 @@ def path_tree(
     ------
     OSError
         If a filesystem operation fails while resolving the root path.
+    ValueError
+        If ``workers`` is less than 1.
+    """
+
+    lines = _iter_tree(
+        root,
+        follow_symlinks=follow_symlinks,
+        include=include,
+        workers=workers,
+        cache=cache,
+        resolve=resolve,
+    )
+
+    # Output goes to a single growable buffer instead of a list of lines.
+    out = io.StringIO()
+    out.write(next(lines))
+    for line in lines:
+        out.write("\n")
+        out.write(line)
+    return out.getvalue()
+
+
+def iter_path_tree(
+    root: Path,
+    *,
+    follow_symlinks: bool = False,
+    include: Callable[[Path], bool] | Iterable[str] = accept_all,
+    workers: int = 1,
+    cache: bool = False,
+    resolve: bool = False,
+) -> Iterator[str]:
+    """
+    Lazily yield the lines of a rendered directory tree.
+
+    This is the generator counterpart of ``path_tree``: the root line comes
+    first, then one line per entry as soon as its directory has been listed,
+    so huge trees can be written out without building the whole string.
+    Joining the lines with ``"\\n"`` gives exactly the string ``path_tree``
+    returns for the same arguments.
+
+    With the default ``workers=1``, memory use is bounded by the depth of the
+    tree. With ``workers > 1``, each top-level subtree is rendered in full by
+    a worker before its lines are yielded.
+
+    Parameters
+    ----------
+    root : pathlib.Path
+        Root directory to display.
+    follow_symlinks, include, workers, cache, resolve
+        Same meaning as for ``path_tree``.
+
+    Returns
+    -------
+    Iterator[str]
+        Lines of the rendered tree, without line terminators.
+
+    Raises
+    ------
+    ValueError
+        If ``workers`` is less than 1. Raised when the function is called,
+        before iteration.
     """
+    return _iter_tree(
+        root,
+        follow_symlinks=follow_symlinks,
+        include=include,
+        workers=workers,
+        cache=cache,
+        resolve=resolve,
+    )
 
-    root = root.resolve()
-    lines: list[str] = [str(root)]
 
-    def iter_children(d: Path) -> list[Path]:
+def _iter_tree(
+    root: Path,
+    *,
+    follow_symlinks: bool,
+    include: Callable[[Path], bool] | Iterable[str],
+    workers: int,
+    cache: bool,
+    resolve: bool,
+) -> Iterator[str]:
+    """
+    Walk ``root`` and lazily yield the lines of its rendered tree.
+
+    This is the shared engine behind ``path_tree`` and ``iter_path_tree``.
+    Arguments are validated and the root path is computed eagerly, so invalid
+    input raises before the first line is requested; directories are only
+    opened once iteration starts.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if resolve or not root.is_absolute():
+        root_path = os.path.realpath(root)
+    else:
+        # Used as given: collapsing ".." lexically would be wrong after a
+        # symlinked component.
+        root_path = os.fspath(root)
+    suffixes = include_suffixes(include)
+    filtering = include is not accept_all
+    # Cached listings are keyed by path, so the descriptor walk is disabled.
+    list_dir = list_children_cached if cache else list_children
+
+    def open_dir(name: str, dir_fd: int | None) -> int | None:
+        """
+        Open a directory for listing, relative to ``dir_fd`` when given.
+
+        Returns ``None`` when the directory cannot be opened this way (e.g.
+        permission errors or descriptor exhaustion); callers then fall back to
+        path-based listing, which reports unreadable directories as empty.
+        The root (opened without ``dir_fd``) may itself be a symbolic link.
+        """
+
+        if follow_symlinks or dir_fd is None:
+            flags = _DIR_OPEN_FLAGS
+        else:
+            flags = _DIR_OPEN_FLAGS | _O_NOFOLLOW
+        try:
+            return os.open(name, flags, dir_fd=dir_fd)
+        except OSError:
+            return None
+
+    def iter_children(d: str | int) -> list[_Child]:
         """
         Return the immediate children of a directory in stable tree order.
 
@@ -101,58 +245,173 @@ def path_tree(
         entries are ordered case-insensitively by name. If the directory cannot
         be read, an empty list is returned.
 
+        The listing and its sort keys are shared with ``path_content``. The
+        ``os.DirEntry`` objects produced by ``os.scandir`` are passed through
+        the traversal as-is: their cached types are read once per entry, and a
+        ``pathlib.Path`` is only built when calling the user-supplied
+        ``include`` predicate.
+
         Parameters
         ----------
-        d : pathlib.Path
-            Directory whose children should be listed.
+        d : str | int
+            Directory whose children should be listed, as a path or as an open
+            directory file descriptor.
 
         Returns
         -------
-        list[pathlib.Path]
-            Sorted list of child paths.
+        list[tuple[os.DirEntry[str], bool, bool]]
+            Sorted list of ``(entry, is_dir, descend)`` records.
         """
 
-        try:
-            children = list(d.iterdir())
-        except OSError:
-            return []
-        # Keep a stable, "tree-like" order: dirs first, then files; case-insensitive name sort.
-        children.sort(key=lambda p: (not is_dir(p), p.name.casefold()))
-        return children
-
-    def rec(d: Path, prefix: str) -> None:
+        # Order (dirs first, case-insensitive names) comes from the shared
+        # listing. Options are checked once per directory, so each
+        # comprehension is specialized and the per-entry loop carries no
+        # option branches.
+        if follow_symlinks:
+            return [(e, e_is_dir, e_is_dir) for e, e_is_dir in list_dir(d)]
+        # is_symlink() is only needed for directories.
+        return [
+            (e, e_is_dir, e_is_dir and not e.is_symlink())
+            for e, e_is_dir in list_dir(d)
+        ]
+
+    def visible_children(d: str, fd: int | None) -> list[_Child]:
         """
-        Recursively render a subtree with proper tree-style indentation.
-
-        This function appends the children of a directory using the appropriate
-        Unicode branch connectors and maintains vertical continuation bars for
-        ancestor levels as needed.
+        Return the children of a directory that pass the ``include`` filter.
 
-        Directory traversal is subject to the ``include`` predicate and the
-        ``follow_symlinks`` setting.
+        Prune + hide are the same here: if ``include()`` is ``False`` for a
+        child, it is neither shown nor descended into.
 
         Parameters
         ----------
-        d : pathlib.Path
-            Directory currently being traversed.
-        prefix : str
-            Prefix string used to align and draw tree branches.
+        d : str
+            Directory whose children should be listed.
+        fd : int | None
+            Open file descriptor of ``d`` to list through, if any.
+
+        Returns
+        -------
+        list[tuple[os.DirEntry[str], bool, bool]]
+            Sorted, filtered ``(entry, is_dir, descend)`` records.
         """
 
-        # Prune + hide are the same here: if include() is False, we neither show nor descend.
-        children = [c for c in iter_children(d) if include(c)]
-        n = len(children)
+        children = iter_children(fd if fd is not None else d)
+        if not filtering:
+            # Default include: no predicate call and no Path per entry.
+            return children
+        if suffixes is not None:
+            # Extension lists only filter files, matched on the bare name.
+            return [c for c in children if c[1] or c[0].name.endswith(suffixes)]
+        return [c for c in children if include(Path(os.path.join(d, c[0].name)))]
+
+    def render(d: str, fd: int | None, prefix: str) -> Iterator[str]:
+        """
+        Yield the lines for the entries below directory ``d``.
 
-        for i, child in enumerate(children):
-            last = i == n - 1
-            branch = "└── " if last else "├── "
-            lines.append(prefix + branch + child.name)
+        ``prefix`` is drawn before each top-level entry of ``d``. The
+        descriptor ``fd`` (if any) is owned by this generator and closed when
+        it finishes, including when ``include`` or a listing raises or the
+        generator is closed early.
+        """
 
-            if is_dir(child):
-                ext = "    " if last else "│   "
-                if follow_symlinks or not child.is_symlink():
-                    rec(child, prefix + ext)
+        # Depth-first rendering with an explicit stack instead of recursion, so
+        # deep trees cannot hit the interpreter recursion limit. Each frame
+        # holds an iterator over a directory's visible children, the index of
+        # its last child, the prefix drawn before its entries, and the
+        # directory's path and open descriptor (closed when the frame is popped).
+        stack: list[tuple[Iterator[tuple[int, _Child]], int, str, str, int | None]] = []
+
+        def push(d: str, fd: int | None, prefix: str) -> None:
+            # The descriptor is owned by the frame once pushed; close it here
+            # if listing fails before that.
+            try:
+                children = visible_children(d, fd)
+            except BaseException:
+                if fd is not None:
+                    os.close(fd)
+                raise
+            stack.append((enumerate(children), len(children) - 1, prefix, d, fd))
 
-    # If you want the filter to be able to exclude the root itself, handle it outside.
-    rec(root, "")
-    return "\n".join(lines)
+        try:
+            push(d, fd, prefix)
+
+            while stack:
+                children, last_index, prefix, dirpath, dir_fd = stack[-1]
+                item = next(children, None)
+                if item is None:
+                    stack.pop()
+                    if dir_fd is not None:
+                        os.close(dir_fd)
+                    continue
+
+                i, (entry, _, descend) = item
+                last = i == last_index
+                yield prefix + _BRANCHES[last] + entry.name
+
+                if descend:
+                    sub_fd = None
+                    if dir_fd is not None and len(stack) < _MAX_OPEN_DIRS:
+                        sub_fd = open_dir(entry.name, dir_fd)
+                    push(
+                        os.path.join(dirpath, entry.name), sub_fd, prefix + _EXTS[last]
+                    )
+        finally:
+            # Only reached with frames left if the walk stopped early.
+            for *_, dir_fd in stack:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+    def render_subtree(d: str, dir_fd: int | None, name: str, prefix: str) -> list[str]:
+        """Return the lines for the entries below child ``name`` of ``d``."""
+
+        sub_fd = open_dir(name, dir_fd) if dir_fd is not None else None
+        return list(render(os.path.join(d, name), sub_fd, prefix))
+
+    def lines() -> Iterator[str]:
+        yield root_path
+
+        # If you want the filter to be able to exclude the root itself, handle it outside.
+        root_fd = open_dir(root_path, None) if _FD_WALK and not cache else None
+        if workers == 1:
+            yield from render(root_path, root_fd, "")
+            return
+
+        # Top-level subtrees are rendered concurrently, each into its own list;
+        # ``os.scandir`` releases the GIL, so per-directory syscall latency
+        # overlaps across threads. Results are merged in listing order, so the
+        # output is identical to a sequential walk.
+        try:
+            top = visible_children(root_path, root_fd)
+            last_index = len(top) - 1
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                subtrees = [
+                    (
+                        pool.submit(
+                            render_subtree,
+                            root_path,
+                            root_fd,
+                            entry.name,
+                            _EXTS[i == last_index],
+                        )
+                        if descend
+                        else None
+                    )
+                    for i, (entry, _, descend) in enumerate(top)
+                ]
+                try:
+                    for i, ((entry, _, _), subtree) in enumerate(zip(top, subtrees)):
+                        yield _BRANCHES[i == last_index] + entry.name
+                        if subtree is not None:
+                            yield from subtree.result()
+                finally:
+                    # Do not start subtrees nobody will read (early close or error).
+                    for subtree in subtrees:
+                        if subtree is not None:
+                            subtree.cancel()
+        finally:
+            # Workers open their subtree relative to the root descriptor, so it is
+            # only closed once the pool has shut down.
+            if root_fd is not None:
+                os.close(root_fd)
+
+    return lines()